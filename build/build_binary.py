@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
 """
 Ultra-simplified binary builder for giv CLI.
-Uses PyInstaller with minimal configuration - relies on auto-detection.
+Runs PyInstaller against the checked-in build/giv.spec.
 """
+import argparse
+import hashlib
+import os
 import platform
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
-def get_binary_name():
-    """Get platform-specific binary name."""
-    system = platform.system().lower()
+def _compute_binary_name(system, machine, release=True):
+    """Compute the platform-specific binary name for a system/machine pair."""
     if system == "darwin":
         system = "macos"
     
-    machine = platform.machine().lower()
     if machine in ("x86_64", "amd64"):
         arch = "x86_64"
     elif machine in ("aarch64", "arm64"):
@@ -24,60 +26,147 @@ def get_binary_name():
         arch = machine
     
     binary_name = f"giv-{system}-{arch}"
-    if system == "windows":
+    if release and system == "windows":
         binary_name += ".exe"
     
     return binary_name
 
 
-def build_binary():
-    """Build binary with minimal PyInstaller configuration."""
+# Host platform facts do not change during a build, so look them up once
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+_BINARY_NAME = _compute_binary_name(_SYSTEM, _MACHINE)
+_DEV_BINARY_NAME = _compute_binary_name(_SYSTEM, _MACHINE, release=False)
+IS_WINDOWS = _SYSTEM == "windows"
+
+
+def get_binary_name(release=True):
+    """Get platform-specific binary name.
+
+    Dev builds are directory bundles, so their name has no ``.exe`` suffix.
+    """
+    return _BINARY_NAME if release else _DEV_BINARY_NAME
+
+
+def collect_submodules_once(project_root):
+    """Return giv's submodules, cached in build/.hidden_imports.txt.
+
+    The list is derived from the package's file layout and only regenerated
+    when a module is added, removed or renamed.
+    """
+    package_dir = project_root / "giv"
+    cache_file = project_root / "build" / ".hidden_imports.txt"
+
+    sources = sorted(path.relative_to(project_root).as_posix() for path in package_dir.rglob("*.py"))
+    digest = hashlib.sha256("\n".join(sources).encode()).hexdigest()
+
+    if cache_file.exists():
+        lines = cache_file.read_text().splitlines()
+        if lines and lines[0] == f"# {digest}":
+            return lines[1:]
+
+    modules = []
+    for source in sources:
+        parts = source[:-len(".py")].split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
+        modules.append(".".join(parts))
+
+    cache_file.write_text("\n".join([f"# {digest}", *modules]) + "\n")
+    return modules
+
+
+def compute_build_signature(project_root, release=True):
+    """Hash every input that affects the built binary."""
+    package_dir = project_root / "giv"
+    inputs = sorted(package_dir.rglob("*.py"))
+    inputs += sorted(path for path in (package_dir / "templates").rglob("*") if path.is_file())
+    inputs += [
+        project_root / "pyproject.toml",
+        project_root / "poetry.lock",
+        project_root / "build" / "giv.spec",
+        # giv.spec imports its binary name, hidden imports and strip setting from here
+        project_root / "build" / "build_binary.py",
+    ]
+
+    digest = hashlib.blake2b()
+    digest.update(b"release" if release else b"dev")
+    # PyInstaller bundles the running interpreter
+    digest.update(sys.version.encode())
+    for path in inputs:
+        if not path.exists():
+            continue
+        digest.update(path.relative_to(project_root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_binary(force=False, release=False):
+    """Build binary from the checked-in PyInstaller spec.
+
+    Release builds produce a single stripped executable. Dev builds produce
+    a ``dist/<binary_name>/`` directory bundle, which is much faster to build
+    and to start. The build is skipped when the output exists and none of its
+    inputs changed since it was built, unless ``force`` is set.
+    """
     project_root = Path(__file__).parent.parent
-    main_script = project_root / "giv" / "__main__.py"
-    templates_dir = project_root / "giv" / "templates"
+    spec_file = project_root / "build" / "giv.spec"
     dist_dir = project_root / "dist"
+    # Persistent work dir so PyInstaller can reuse its analysis cache between builds
+    work_dir = project_root / "build" / ".pyinstaller-work"
     
-    # Create dist directory
+    # Create dist and work directories
     dist_dir.mkdir(exist_ok=True)
+    work_dir.mkdir(parents=True, exist_ok=True)
     
-    binary_name = get_binary_name()
-    print(f"Building {binary_name}...")
+    binary_name = get_binary_name(release)
+    binary_path = dist_dir / binary_name
+    entry_point = binary_path if release else binary_path / (binary_name + (".exe" if IS_WINDOWS else ""))
+    # Kept next to the PyInstaller cache so it never ends up in release artifacts
+    sig_file = work_dir / f"{binary_name}.sig"
     
-    # Determine platform-specific settings
-    is_windows = platform.system().lower() == "windows"
+    signature = compute_build_signature(project_root, release)
+    if not force and entry_point.exists() and sig_file.exists() and sig_file.read_text() == signature:
+        print(f"{binary_name} is up-to-date: {entry_point}")
+        return True
     
-    # Use appropriate path separator for --add-data (Windows uses semicolon, Unix uses colon)
-    path_separator = ";" if is_windows else ":"
-    add_data_param = f"{templates_dir}{path_separator}giv/templates"
+    print(f"Building {binary_name} ({'release' if release else 'dev'})...")
     
-    # PyInstaller command optimized for compatibility
+    # Dev and release builds share the output path, so drop one left by the other mode
+    if release and binary_path.is_dir():
+        shutil.rmtree(binary_path)
+    elif not release and binary_path.is_file():
+        binary_path.unlink()
+    
+    # Build settings (onefile, templates, hidden imports, strip, UPX) live in giv.spec
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
-        "--name", binary_name,
+        "--noconfirm",
         "--distpath", str(dist_dir),
-        "--add-data", add_data_param,
-        "--collect-submodules", "giv",  # This handles most imports automatically
-        "--noupx",  # Disable UPX compression for better compatibility
-        str(main_script)
+        "--workpath", str(work_dir),
+        str(spec_file)
     ]
+    env = {**os.environ, "GIV_BINARY_NAME": binary_name, "GIV_ONEFILE": "1" if release else "0"}
     
-    # Add --strip flag only on Unix-like systems (not supported on Windows)
-    if not is_windows:
-        cmd.insert(-1, "--strip")  # Insert before the script path
-    
-    try:
-        subprocess.run(cmd, check=True, cwd=project_root)
-        print(f"Binary built successfully: {dist_dir / binary_name}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Build failed with exit code: {e.returncode}")
+    result = subprocess.run(cmd, cwd=project_root, env=env)
+    if result.returncode != 0:
+        print(f"Build failed with exit code: {result.returncode}")
         return False
+    
+    sig_file.write_text(signature)
+    print(f"Binary built successfully: {entry_point}")
+    return True
 
 
 def main():
     """Entry point for Poetry script."""
-    if not build_binary():
+    parser = argparse.ArgumentParser(description="Build the giv binary with PyInstaller.")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the inputs are unchanged")
+    parser.add_argument("--release", action="store_true", help="build a single-file executable for distribution")
+    args = parser.parse_args()
+    
+    if not build_binary(force=args.force, release=args.release):
         sys.exit(1)
 
 
@@ -0,0 +1,56 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for the giv CLI binary.
+
+Invoked by build/build_binary.py. The binary name is passed through the
+GIV_BINARY_NAME environment variable so the same spec works on every
+platform; it falls back to the name computed for the current host.
+GIV_ONEFILE=0 selects a dev build: an unarchived directory bundle instead
+of the single-file release executable.
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, SPECPATH)
+from build_binary import IS_WINDOWS, collect_submodules_once, get_binary_name  # noqa: E402
+
+project_root = Path(SPECPATH).parent
+onefile = os.environ.get("GIV_ONEFILE", "1") == "1"
+binary_name = os.environ.get("GIV_BINARY_NAME") or get_binary_name(onefile)
+
+a = Analysis(
+    [str(project_root / "giv" / "__main__.py")],
+    pathex=[str(project_root)],
+    datas=[(str(project_root / "giv" / "templates"), "giv/templates")],
+    hiddenimports=collect_submodules_once(project_root),
+    noarchive=not onefile,
+)
+pyz = PYZ(a.pure)
+
+if onefile:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name=binary_name,
+        debug=False,
+        strip=not IS_WINDOWS,  # --strip is not supported on Windows
+        upx=False,  # Disable UPX compression for better compatibility
+        console=True,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name=binary_name,
+        debug=False,
+        strip=False,
+        upx=False,
+        console=True,
+    )
+    coll = COLLECT(exe, a.binaries, a.datas, strip=False, upx=False, name=binary_name)
@@ -30,6 +30,15 @@ class MarkdownProcessor:
     # Regex patterns
     code_fence_re = re.compile(r"```.*?```", re.DOTALL)
     top_header_re = re.compile(r"^#\s.*$", re.MULTILINE)
+    image_re = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+    link_re = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+    bold_re = re.compile(r'\*\*([^*]*)\*\*')
+    italic_re = re.compile(r'\*([^*]*)\*')
+    header_prefix_re = re.compile(r'^[\s]*#+[\s]*')
+    blockquote_re = re.compile(r'^[\s]*>[\s]*')
+    header_level_re = re.compile(r'^(#+)')
+    list_item_re = re.compile(r'^(\s*)[\-\*\+]\s+')
+    whitespace_re = re.compile(r'\s+')
     
     @staticmethod
     def print_md_file(file_path: str) -> None:
@@ -108,25 +117,25 @@ class MarkdownProcessor:
                 continue
                 
             # Remove images: ![alt](url)
-            line = re.sub(r'!\[[^\]]*\]\([^)]*\)', '', line)
+            line = MarkdownProcessor.image_re.sub('', line)
             
             # Remove links but keep text: [text](url) -> text
-            line = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', line)
+            line = MarkdownProcessor.link_re.sub(r'\1', line)
             
             # Remove backticks
             line = line.replace('`', '')
             
             # Remove bold: **text** -> text
-            line = re.sub(r'\*\*([^*]*)\*\*', r'\1', line)
+            line = MarkdownProcessor.bold_re.sub(r'\1', line)
             
             # Remove italic: *text* -> text  
-            line = re.sub(r'\*([^*]*)\*', r'\1', line)
+            line = MarkdownProcessor.italic_re.sub(r'\1', line)
             
             # Remove headers: ### text -> text
-            line = re.sub(r'^[\s]*#+[\s]*', '', line)
+            line = MarkdownProcessor.header_prefix_re.sub('', line)
             
             # Remove blockquotes: > text -> text
-            line = re.sub(r'^[\s]*>[\s]*', '', line)
+            line = MarkdownProcessor.blockquote_re.sub('', line)
             
             processed_lines.append(line)
             
@@ -289,10 +298,10 @@ class MarkdownProcessor:
                     
                 # Skip old section content
                 if in_section:
-                    if re.match(r'^#+', line):
+                    level_match = MarkdownProcessor.header_level_re.match(line)
+                    if level_match:
                         # Check if this is a header of same or higher level
-                        level_match = re.match(r'^(#+)', line)
-                        if level_match and len(level_match.group(1)) <= header_level:
+                        if len(level_match.group(1)) <= header_level:
                             in_section = False
                             result_lines.append(line)
                     continue
@@ -527,17 +536,16 @@ class MarkdownProcessor:
                 level = len(stripped) - len(stripped.lstrip('#'))
                 header_text = stripped.lstrip('#').strip()
                 # Normalize spaces in header text
-                header_text = re.sub(r'\s+', ' ', header_text)
+                header_text = self.whitespace_re.sub(' ', header_text)
                 line = '#' * level + ' ' + header_text
             
             # Clean up list formatting
-            elif re.match(r'^\s*[\-\*\+]\s+', line):
+            elif (list_match := self.list_item_re.match(line)):
                 # Ensure consistent list formatting
-                indent_match = re.match(r'^(\s*)', line)
-                indent = indent_match.group(1) if indent_match else ''
-                list_content = re.sub(r'^(\s*[\-\*\+]\s+)', '- ', line.lstrip())
+                indent = list_match.group(1)
+                list_content = self.list_item_re.sub('- ', line.lstrip(), count=1)
                 # Normalize spaces in list content
-                list_content = re.sub(r'\s+', ' ', list_content.rstrip())
+                list_content = self.whitespace_re.sub(' ', list_content.rstrip())
                 line = indent + list_content
             
             # Clean up regular text lines (normalize multiple spaces)
@@ -545,9 +553,9 @@ class MarkdownProcessor:
                 # Preserve leading whitespace but normalize internal spaces
                 leading_space = len(line) - len(line.lstrip())
                 if leading_space > 0:
-                    line = ' ' * leading_space + re.sub(r'\s+', ' ', line.lstrip().rstrip())
+                    line = ' ' * leading_space + self.whitespace_re.sub(' ', line.lstrip().rstrip())
                 else:
-                    line = re.sub(r'\s+', ' ', line.strip())
+                    line = self.whitespace_re.sub(' ', line.strip())
             
             cleaned_lines.append(line)
         
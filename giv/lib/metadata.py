@@ -19,7 +19,12 @@ import re
 import subprocess
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,17 @@ class ProjectMetadata:
     
     _cache: Dict[str, Dict[str, str]] = {}
     
+    # Common tag prefixes like 'v', 'release-', etc., tried in order
+    _tag_version_patterns = [
+        re.compile(r'^v(.+)$', re.IGNORECASE),          # v1.2.3 -> 1.2.3
+        re.compile(r'^release-(.+)$', re.IGNORECASE),   # release-1.2.3 -> 1.2.3
+        re.compile(r'^version-(.+)$', re.IGNORECASE),   # version-1.2.3 -> 1.2.3
+        re.compile(r'^(.+)$'),                          # 1.2.3 -> 1.2.3 (no prefix)
+    ]
+    _version_number_re = re.compile(r'^\d+(\.\d+)*')
+    _dunder_version_re = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+    _surrounding_quotes_re = re.compile(r'^["\']|["\']$')
+    
     @classmethod
     def detect_project_type(cls, path: Optional[Path] = None) -> str:
         """Detect project type based on files present, matching Bash detect_project_type.
@@ -167,19 +183,12 @@ class ProjectMetadata:
             return ""
         
         # Remove common prefixes like 'v', 'release-', etc.
-        patterns = [
-            r'^v(.+)$',                    # v1.2.3 -> 1.2.3
-            r'^release-(.+)$',             # release-1.2.3 -> 1.2.3
-            r'^version-(.+)$',             # version-1.2.3 -> 1.2.3
-            r'^(.+)$',                     # 1.2.3 -> 1.2.3 (no prefix)
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, tag, re.IGNORECASE)
+        for pattern in cls._tag_version_patterns:
+            match = pattern.match(tag)
             if match:
                 version = match.group(1)
                 # Check if it looks like a version number
-                if re.match(r'^\d+(\.\d+)*', version):
+                if cls._version_number_re.match(version):
                     return version
         
         return tag  # Return original tag if no version pattern found
@@ -205,18 +214,16 @@ class ProjectMetadata:
         # Try pyproject.toml first
         content = cls.get_file_content_at_commit("pyproject.toml", commit)
         if content:
-            try:
-                import tomllib
-                data = tomllib.loads(content)
-                
+            data = cls._load_toml(content)
+            if data is not None:
                 # Try PEP 621 project metadata first
-                project = data.get("project", {})
+                project = cls._toml_table(data, "project")
                 if key in project:
                     value = project[key]
                     return str(value) if value is not None else ""
                 
                 # Try Poetry metadata
-                poetry = data.get("tool", {}).get("poetry", {})
+                poetry = cls._toml_table(data, "tool", "poetry")
                 if key in poetry:
                     value = poetry[key]
                     return str(value) if value is not None else ""
@@ -226,8 +233,7 @@ class ProjectMetadata:
                     return str(project["name"])
                 elif key == "title" and "name" in poetry:
                     return str(poetry["name"])
-                    
-            except Exception:
+            else:
                 # Fallback to regex parsing for malformed TOML or missing tomllib
                 # Try PEP 621 project section first
                 result = cls._parse_toml_like(content, key, "project")
@@ -262,19 +268,18 @@ class ProjectMetadata:
         if not content:
             return ""
         
-        try:
-            import tomllib
-            data = tomllib.loads(content)
-            package = data.get("package", {})
-            value = package.get(key, "")
-            
-            # Handle special key mappings
-            if key == "title" and "name" in package:
-                return str(package["name"])
-            
-            return str(value) if value is not None else ""
-        except Exception:
+        data = cls._load_toml(content)
+        if data is None:
             return cls._parse_toml_like(content, key, section="package")
+        
+        package = cls._toml_table(data, "package")
+        value = package.get(key, "")
+        
+        # Handle special key mappings
+        if key == "title" and "name" in package:
+            return str(package["name"])
+        
+        return str(value) if value is not None else ""
 
     @classmethod
     def _get_go_metadata(cls, key: str, commit: str) -> str:
@@ -319,7 +324,7 @@ class ProjectMetadata:
             # Handle Python __version__.py files
             if version_file.endswith(".py"):
                 if key == "version":
-                    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+                    match = cls._dunder_version_re.search(content)
                     if match:
                         return match.group(1)
                 continue
@@ -344,7 +349,7 @@ class ProjectMetadata:
                         if len(parts) == 2:
                             value = parts[1].strip()
                             # Remove quotes
-                            value = re.sub(r'^["\']|["\']$', '', value)
+                            value = cls._surrounding_quotes_re.sub('', value)
                             return value
         
         return ""
@@ -377,6 +382,26 @@ class ProjectMetadata:
         match = re.search(pattern, content)
         return match.group(1) if match else ""
 
+    @staticmethod
+    def _load_toml(content: str) -> Optional[Dict[str, Any]]:
+        """Parse TOML content, or return None if tomllib is unavailable or the content is malformed."""
+        if tomllib is None:
+            return None
+        try:
+            return tomllib.loads(content)
+        except tomllib.TOMLDecodeError:
+            return None
+
+    @staticmethod
+    def _toml_table(data: Dict[str, Any], *keys: str) -> Dict[str, Any]:
+        """Walk nested TOML tables, returning an empty dict if any level is missing or not a table."""
+        table: Any = data
+        for key in keys:
+            table = table.get(key)
+            if not isinstance(table, dict):
+                return {}
+        return table
+
     @classmethod
     def _parse_toml_like(cls, content: str, key: str, section: str = "project") -> str:
         """Parse TOML-like content with regex fallback."""
@@ -396,7 +421,7 @@ class ProjectMetadata:
                 if len(parts) == 2 and parts[0].strip() == key:
                     value = parts[1].strip()
                     # Remove quotes
-                    value = re.sub(r'^["\']|["\']$', '', value)
+                    value = cls._surrounding_quotes_re.sub('', value)
                     return value
         
         return ""
@@ -210,15 +210,10 @@ Message: {message}"""
                     except OSError as e:
                         logger.warning(f"Failed to clear cache {cache_file}: {e}")
         else:
-            # Clear all cache files
-            for cache_file in cache_dir.glob("*-summary.md"):
-                try:
-                    cache_file.unlink()
-                    logger.debug(f"Cleared cache: {cache_file}")
-                except OSError as e:
-                    logger.warning(f"Failed to clear cache {cache_file}: {e}")
-            
-            for cache_file in cache_dir.glob("*-history.md"):
+            # Clear all summary and history cache files in a single pass
+            for cache_file in cache_dir.iterdir():
+                if not cache_file.name.endswith(("-summary.md", "-history.md")):
+                    continue
                 try:
                     cache_file.unlink()
                     logger.debug(f"Cleared cache: {cache_file}")
@@ -163,11 +163,16 @@ def calculate_file_sha256(file_path: Union[str, Path]) -> str:
         If file cannot be read
     """
     file_path = Path(file_path)
-    sha256_hash = hashlib.sha256()
     
     with open(file_path, 'rb') as f:
+        # Python 3.11+ streams the file through the digest without
+        # Python-level chunking
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        sha256_hash = hashlib.sha256()
         # Read file in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             sha256_hash.update(chunk)
     
     return sha256_hash.hexdigest()
@@ -9,7 +9,7 @@ the Python implementation of giv CLI. It includes utilities for:
 - Comparing output with Bash implementation
 """
 import os
-import tempfile
+import shutil
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Dict
@@ -19,37 +19,17 @@ import pytest
 from giv.config import ConfigManager
 
 
-@contextmanager
-def change_directory(path: Path):
-    """Context manager to temporarily change working directory for git repository testing."""
-    prev_cwd = os.getcwd()
-    os.chdir(path)
-    try:
-        yield
-    finally:
-        os.chdir(prev_cwd)
-
-
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
+# Test configuration written by the config manager fixtures
+TEST_CONFIG = """# Test configuration
+api.url=https://api.example.test
+api.key=test-key-12345
+temperature=0.7
+max_tokens=4096
+"""
 
-@pytest.fixture
-def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary git repository with realistic project structure."""
-    repo_dir = temp_dir / "test_repo"
-    repo_dir.mkdir()
-    
-    # Initialize git repo
-    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir, check=True)
-    
-    # Create realistic project structure
-    (repo_dir / "package.json").write_text("""{
+# Files committed as the initial state of every test repository
+INITIAL_REPO_FILES = {
+    "package.json": """{
   "name": "test-project",
   "version": "1.2.0",
   "description": "A test project for integration testing",
@@ -57,9 +37,8 @@ def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
   "scripts": {
     "test": "echo 'test'"
   }
-}""")
-    
-    (repo_dir / "README.md").write_text("""# Test Project
+}""",
+    "README.md": """# Test Project
 
 This is a test project for integration testing.
 
@@ -67,9 +46,8 @@ This is a test project for integration testing.
 
 - Feature A
 - Feature B
-""")
-    
-    (repo_dir / "CHANGELOG.md").write_text("""# Changelog
+""",
+    "CHANGELOG.md": """# Changelog
 
 All notable changes to this project will be documented in this file.
 
@@ -77,31 +55,71 @@ All notable changes to this project will be documented in this file.
 
 ## [1.2.0] - 2023-01-01
 - Initial release
-""")
-    
-    # Create some source files
-    src_dir = repo_dir / "src"
-    src_dir.mkdir()
-    
-    (src_dir / "index.js").write_text("""console.log('Hello, world!');
+""",
+    "src/index.js": """console.log('Hello, world!');
 
 function add(a, b) {
     return a + b;
 }
 
 module.exports = { add };
-""")
-    
-    (src_dir / "utils.js").write_text("""function formatDate(date) {
+""",
+    "src/utils.js": """function formatDate(date) {
     return date.toISOString().split('T')[0];
 }
 
 module.exports = { formatDate };
-""")
+""",
+}
+
+
+@contextmanager
+def change_directory(path: Path):
+    """Context manager to temporarily change working directory for git repository testing."""
+    prev_cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(prev_cwd)
+
+
+@pytest.fixture
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for testing.
     
-    # Initial commit
-    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo_dir, check=True)
+    Backed by pytest's tmp_path, which is reaped lazily across runs instead
+    of being removed synchronously at the end of every test.
+    """
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory) -> Path:
+    """Build the initial test repository once per session.
+    
+    Per-test repository fixtures copy this directory instead of re-running
+    git init/add/commit for every test.
+    """
+    repo_dir = tmp_path_factory.mktemp("git_template") / "test_repo"
+    repo_dir.mkdir()
+    
+    # Initialize git repo with consistent config
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir, check=True)
+    
+    # Create consistent initial state
+    setup_initial_repo_state(repo_dir)
+    
+    return repo_dir
+
+
+@pytest.fixture
+def git_repo(temp_dir: Path, git_repo_template: Path) -> Generator[Path, None, None]:
+    """Create a temporary git repository with realistic project structure."""
+    repo_dir = temp_dir / "test_repo"
+    shutil.copytree(git_repo_template, repo_dir)
     
     yield repo_dir
 
@@ -113,12 +131,7 @@ def config_manager(temp_dir: Path) -> ConfigManager:
     config_dir.mkdir()
     
     config_file = config_dir / "config"
-    config_file.write_text("""# Test configuration
-api.url=https://api.example.test
-api.key=test-key-12345
-temperature=0.7
-max_tokens=4096
-""")
+    config_file.write_text(TEST_CONFIG)
     
     return ConfigManager(config_path=config_file)
 
@@ -292,59 +305,11 @@ def clean_environment():
 def setup_initial_repo_state(repo_dir: Path) -> None:
     """Setup consistent initial repository state for all tests."""
     # Create realistic project structure
-    (repo_dir / "package.json").write_text("""{
-  "name": "test-project",
-  "version": "1.2.0",
-  "description": "A test project for integration testing",
-  "main": "index.js",
-  "scripts": {
-    "test": "echo 'test'"
-  }
-}""")
-    
-    (repo_dir / "README.md").write_text("""# Test Project
-
-This is a test project for integration testing.
-
-## Features
-
-- Feature A
-- Feature B
-""")
-    
-    (repo_dir / "CHANGELOG.md").write_text("""# Changelog
-
-All notable changes to this project will be documented in this file.
-
-## [Unreleased]
-
-## [1.2.0] - 2023-01-01
-- Initial release
-""")
-    
-    # Create some source files
-    src_dir = repo_dir / "src"
-    src_dir.mkdir()
-    
-    (src_dir / "index.js").write_text("""console.log('Hello, world!');
-
-function add(a, b) {
-    return a + b;
-}
-
-module.exports = { add };
-""")
-    
-    (src_dir / "utils.js").write_text("""function formatDate(date) {
-    return date.toISOString().split('T')[0];
-}
-
-module.exports = { formatDate };
-""")
+    create_test_files(repo_dir, INITIAL_REPO_FILES)
     
     # Initial commit
     subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], cwd=repo_dir, check=True)
 
 
 def create_test_files(repo_dir: Path, files: Dict[str, str]) -> None:
@@ -359,11 +324,10 @@ def commit_changes(repo_dir: Path, message: str) -> str:
     """Commit current changes and return commit hash."""
     subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
     subprocess.run(
-        ["git", "commit", "-m", message], 
+        ["git", "commit", "-q", "-m", message], 
         cwd=repo_dir, 
         check=True,
-        capture_output=True,
-        text=True
+        stdout=subprocess.DEVNULL
     )
     
     # Get the commit hash
@@ -378,38 +342,27 @@ def commit_changes(repo_dir: Path, message: str) -> str:
 
 
 @pytest.fixture
-def isolated_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
+def isolated_git_repo(temp_dir: Path, git_repo_template: Path, monkeypatch) -> Path:
     """Create an isolated git repository with consistent history for each test.
     
     This fixture:
     - Creates a unique temporary Git repository for each test
-    - Initializes it with consistent configuration and initial state
+    - Copies the session-wide template repository, so every test starts
+      from the same configuration and initial commit
     - Changes to the repository directory for the test duration
     - Automatically restores the original directory on cleanup
     """
     repo_dir = temp_dir / "test_repo"
-    repo_dir.mkdir()
-    
-    # Initialize git repo with consistent config
-    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir, check=True)
-    
-    # Create consistent initial state
-    setup_initial_repo_state(repo_dir)
+    shutil.copytree(git_repo_template, repo_dir)
     
     # Set as working directory for the test
-    old_cwd = os.getcwd()
-    os.chdir(repo_dir)
+    monkeypatch.chdir(repo_dir)
     
-    try:
-        yield repo_dir
-    finally:
-        os.chdir(old_cwd)
+    return repo_dir
 
 
 @pytest.fixture
-def working_directory(temp_dir: Path) -> Generator[Path, None, None]:
+def working_directory(temp_dir: Path, monkeypatch) -> Path:
     """Change to a temporary directory for the duration of the test.
     
     This fixture:
@@ -417,13 +370,9 @@ def working_directory(temp_dir: Path) -> Generator[Path, None, None]:
     - Automatically restores the original directory on cleanup
     - Provides complete isolation from the project directory
     """
-    old_cwd = os.getcwd()
-    os.chdir(temp_dir)
+    monkeypatch.chdir(temp_dir)
     
-    try:
-        yield temp_dir
-    finally:
-        os.chdir(old_cwd)
+    return temp_dir
 
 
 @pytest.fixture
@@ -439,12 +388,7 @@ def isolated_config_manager(temp_dir: Path) -> ConfigManager:
     config_dir.mkdir()
     
     config_file = config_dir / "config"
-    config_file.write_text("""# Test configuration
-api.url=https://api.example.test
-api.key=test-key-12345
-temperature=0.7
-max_tokens=4096
-""")
+    config_file.write_text(TEST_CONFIG)
     
     return ConfigManager(config_path=config_file)
 
@@ -1,35 +1,27 @@
 import os
-import shutil
 import tempfile
-from pathlib import Path
 import pytest
 from giv.lib.git import GitRepository
 from giv.lib.summarization import CommitSummarizer
 from unittest.mock import Mock
 
-def setup_cache_dir():
-    cache_dir = Path.cwd() / ".giv" / "cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
-
-def teardown_cache_dir():
-    cache_dir = Path.cwd() / ".giv" / "cache"
-    if cache_dir.exists():
-        shutil.rmtree(cache_dir)
+@pytest.fixture(scope="module")
+def summarizer():
+    repo = GitRepository()
+    return CommitSummarizer(repo)
 
-@pytest.fixture(autouse=True)
-def clean_cache():
-    teardown_cache_dir()
-    yield
-    teardown_cache_dir()
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # giv caches under <cwd>/.giv/cache, so run each test from its own tmp dir
+    d = tmp_path / ".giv" / "cache"
+    d.mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    return d
 
-def test_cache_cleared_for_current_and_cached():
-    repo = GitRepository()
-    summarizer = CommitSummarizer(repo)
+def test_cache_cleared_for_current_and_cached(summarizer, cache_dir):
     # Simulate summary and history for --current
     summarizer.git.cache_summary("--current", "summary", verbose=False)
     summarizer.git.build_commit_history("--current", verbose=False)
-    cache_dir = setup_cache_dir()
     assert not (cache_dir / "--current-summary.md").exists()
     assert not (cache_dir / "--current-history.md").exists()
     # Simulate summary and history for --cached
@@ -38,12 +30,9 @@ def test_cache_cleared_for_current_and_cached():
     assert not (cache_dir / "--cached-summary.md").exists()
     assert not (cache_dir / "--cached-history.md").exists()
 
-def test_cache_preserved_if_verbose():
-    repo = GitRepository()
-    summarizer = CommitSummarizer(repo)
+def test_cache_preserved_if_verbose(summarizer, cache_dir):
     summarizer.git.cache_summary("--current", "summary", verbose=True)
     summarizer.git.build_commit_history("--current", verbose=True)
-    cache_dir = setup_cache_dir()
     assert (cache_dir / "--current-summary.md").exists()
     assert (cache_dir / "--current-history.md").exists()
     summarizer.git.cache_summary("--cached", "summary", verbose=True)
@@ -51,8 +40,7 @@ def test_cache_preserved_if_verbose():
     assert (cache_dir / "--cached-summary.md").exists()
     assert (cache_dir / "--cached-history.md").exists()
 
-def test_clear_cache_subcommand():
-    cache_dir = setup_cache_dir()
+def test_clear_cache_subcommand(cache_dir):
     # Create dummy cache files
     (cache_dir / "dummy-summary.md").write_text("test")
     (cache_dir / "dummy-history.md").write_text("test")
@@ -67,3 +55,13 @@ def test_clear_cache_subcommand():
     cmd.run()
     assert not (cache_dir / "dummy-summary.md").exists()
     assert not (cache_dir / "dummy-history.md").exists()
+
+def test_summarizer_clear_cache_all(summarizer, cache_dir):
+    # Only summary and history files are removed
+    (cache_dir / "abc-summary.md").write_text("test")
+    (cache_dir / "abc-history.md").write_text("test")
+    (cache_dir / "notes.txt").write_text("test")
+    summarizer.clear_cache()
+    assert not (cache_dir / "abc-summary.md").exists()
+    assert not (cache_dir / "abc-history.md").exists()
+    assert (cache_dir / "notes.txt").exists()
@@ -54,7 +54,7 @@ class TestGitHistory:
         # Make another commit - working directory is already set
         (isolated_git_repo / "src" / "second.js").write_text("console.log('second');")
         subprocess.run(["git", "add", "."], cwd=isolated_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Second commit"], cwd=isolated_git_repo, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "Second commit"], cwd=isolated_git_repo, check=True)
         
         gh = GitHistory()
         diff = gh.get_diff(revision="HEAD~1..HEAD")
@@ -256,7 +256,7 @@ class TestGitRevisionHandling:
             # Create second commit
             (git_repo / "file2.txt").write_text("second file")
             subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
-            subprocess.run(["git", "commit", "-m", "Second commit"], cwd=git_repo, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", "Second commit"], cwd=git_repo, check=True)
             
             gh = GitHistory()
             diff = gh.get_diff(revision="HEAD~1..HEAD")
@@ -276,7 +276,7 @@ class TestGitRevisionHandling:
             # Create second commit
             (git_repo / "file3.txt").write_text("third file")
             subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
-            subprocess.run(["git", "commit", "-m", "Third commit"], cwd=git_repo, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", "Third commit"], cwd=git_repo, check=True)
             
             gh = GitHistory()
             metadata = gh.build_history_metadata("HEAD~1")
@@ -48,7 +48,7 @@ description = "Test project"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -82,7 +82,7 @@ edition = "2021"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -107,7 +107,7 @@ edition = "2021"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -132,7 +132,7 @@ edition = "2021"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -159,7 +159,7 @@ edition = "2021"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -192,7 +192,7 @@ version = "1.0.0"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -218,7 +218,7 @@ class TestProjectMetadataTitleDetection:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -249,7 +249,7 @@ version = "1.0.0"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -281,7 +281,7 @@ setup(
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -306,7 +306,7 @@ setup(
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -338,7 +338,7 @@ version = "1.0.0"
             project_root.mkdir()
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -361,7 +361,7 @@ version = "1.0.0"
             project_root.mkdir()
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -413,7 +413,7 @@ class TestProjectMetadataFileFormats:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -457,7 +457,7 @@ setting = "value"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -505,7 +505,7 @@ setup(
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -559,7 +559,7 @@ class TestProjectMetadataErrorHandling:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -582,13 +582,71 @@ class TestProjectMetadataErrorHandling:
                 assert version == "0.0.0"  # Default fallback
                 assert title == project_root.name  # Directory name fallback
 
+    def test_pyproject_toml_non_table_sections(self):
+        """Test pyproject.toml where project/tool are values, not tables."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+
+            # Initialize git repository
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
+            subprocess.run(
+                ["git", "config", "user.email", "test@example.com"],
+                cwd=project_root,
+                check=True,
+            )
+            subprocess.run(
+                ["git", "config", "user.name", "Test User"],
+                cwd=project_root,
+                check=True,
+            )
+
+            pyproject_file = project_root / "pyproject.toml"
+            pyproject_file.write_text('project = "x"\ntool = "x"\n')
+
+            with change_directory(project_root):
+                # Valid TOML with unexpected shapes should not crash
+                version = ProjectMetadata.get_version(commit="--current")
+                title = ProjectMetadata.get_title(commit="--current")
+
+                assert version == "0.0.0"
+                assert title == project_root.name
+
+    def test_cargo_toml_non_table_package(self):
+        """Test Cargo.toml where package is a value, not a table."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+
+            # Initialize git repository
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
+            subprocess.run(
+                ["git", "config", "user.email", "test@example.com"],
+                cwd=project_root,
+                check=True,
+            )
+            subprocess.run(
+                ["git", "config", "user.name", "Test User"],
+                cwd=project_root,
+                check=True,
+            )
+
+            cargo_file = project_root / "Cargo.toml"
+            cargo_file.write_text("package = 3\n")
+
+            with change_directory(project_root):
+                # Valid TOML with unexpected shapes should not crash
+                version = ProjectMetadata.get_version(commit="--current")
+                title = ProjectMetadata.get_title(commit="--current")
+
+                assert version == "0.0.0"
+                assert title == project_root.name
+
     def test_malformed_package_json(self):
         """Test handling malformed package.json."""
         with tempfile.TemporaryDirectory() as tmpdir:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -617,7 +675,7 @@ class TestProjectMetadataErrorHandling:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -644,7 +702,7 @@ class TestProjectMetadataErrorHandling:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -681,7 +739,7 @@ class TestProjectMetadataVersionFormatting:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -715,7 +773,7 @@ class TestProjectMetadataVersionFormatting:
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -747,7 +805,7 @@ class TestProjectMetadataIntegration:
             project_root.mkdir()
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
@@ -788,7 +846,7 @@ python = "^3.8"
             monorepo.mkdir()
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=monorepo, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=monorepo, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=monorepo,
@@ -833,7 +891,7 @@ python = "^3.8"
             project_root = Path(tmpdir)
 
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=project_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=project_root, check=True)
             subprocess.run(
                 ["git", "config", "user.email", "test@example.com"],
                 cwd=project_root,
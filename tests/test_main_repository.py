@@ -44,7 +44,7 @@ class TestMainRepositoryBehavior:
         test_file = Path(git_repo) / "test.txt"
         test_file.write_text("test content")
         subprocess.run(["git", "add", "test.txt"], cwd=git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], 
+        subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], 
                      cwd=git_repo, check=True)
         
         # Modify file to have working tree changes
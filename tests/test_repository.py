@@ -139,7 +139,7 @@ class TestRepositoryInfo:
             test_file = Path(git_repo) / "test.txt"
             test_file.write_text("test content")
             subprocess.run(["git", "add", "test.txt"], cwd=git_repo, check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], 
+            subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], 
                          cwd=git_repo, check=True)
             
             info = get_repository_info()
@@ -174,7 +174,7 @@ class TestRepositoryIntegration:
             repo_root = Path(tmpdir)
             
             # Initialize git repository
-            subprocess.run(["git", "init"], cwd=repo_root, check=True)
+            subprocess.run(["git", "init", "-q"], cwd=repo_root, check=True)
             subprocess.run(["git", "config", "user.email", "test@example.com"], 
                          cwd=repo_root, check=True)
             subprocess.run(["git", "config", "user.name", "Test User"], 